@@ -5,14 +5,14 @@ Streamlit Web Application
 
 import streamlit as st
 import os
+import hashlib
 from datetime import datetime
-import json
+from typing import Dict, List, Optional, Tuple
 
 # Import parser modules
-from parser.extractor import extract_text
-from parser.preprocessor import preprocess_resume_text
 from parser.analyzer import ResumeAnalyzer
-from parser.exporter import export_to_json, export_to_csv, format_for_display, create_summary_stats
+from parser.batch import parse_resume, parse_resumes_parallel
+from parser.exporter import export_to_json, export_to_csv, format_for_display, create_summary_stats, to_json
 
 
 # Page configuration
@@ -24,7 +24,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -53,22 +53,116 @@ st.markdown("""
         color: #666;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static sidebar content, rendered as a single element
+SIDEBAR_MARKDOWN = """
+### About
+**ResumeFit** extracts:
+- 👤 Personal Information
+- 💼 Skills
+- 🎓 Education
+- 💻 Work Experience
+
+**Supported formats:** PDF, DOCX
+
+### Instructions
+1. Upload one or more resume files
+2. Wait for processing
+3. View extracted data
+4. Download results
+"""
+
+# Template for a single skill tag in the Results tab
+SKILL_TAG = '<span style="background-color: #e0e0e0; padding: 0.3rem 0.6rem; margin: 0.2rem; border-radius: 0.3rem; display: inline-block;">{}</span>'
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_analyzer() -> ResumeAnalyzer:
+    """Load the analyzer (and its spaCy model) once per process, shared by all sessions."""
+    return ResumeAnalyzer()
 
 
 def initialize_session_state():
     """Initialize session state variables."""
-    if 'parsed_data' not in st.session_state:
-        st.session_state.parsed_data = None
+    if 'parsed_results' not in st.session_state:
+        st.session_state.parsed_results = []
     if 'analyzer' not in st.session_state:
         try:
-            st.session_state.analyzer = ResumeAnalyzer()
+            st.session_state.analyzer = get_analyzer()
         except Exception as e:
             st.error(f"Error initializing analyzer: {str(e)}")
             st.info("Please make sure spaCy model is installed: `python -m spacy download en_core_web_sm`")
             st.stop()
 
 
+def file_hash(file_bytes: bytes) -> str:
+    """Content hash used to recognise re-uploads of the same resume."""
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+
+def file_extension(file_name: str) -> str:
+    """Lowercase extension of an uploaded file name ('pdf', 'docx', ...)."""
+    return file_name.rsplit('.', 1)[-1].lower()
+
+
+@st.cache_data(show_spinner=False)
+def parse_resumes(file_keys: Tuple[Tuple[str, str, str], ...],
+                  _file_contents: List[bytes]) -> Tuple[List[Tuple[str, Dict]], List[str]]:
+    """
+    Extract, preprocess and analyze a batch of uploaded resumes.
+    
+    Several files are parsed in parallel worker processes. Cached on
+    ``file_keys`` (name, content hash, file type), so parsing the same files
+    again skips the whole pipeline.
+    
+    Returns:
+        ([(file name, parsed data), ...], [names of files that failed extraction])
+    """
+    files = [(file_bytes, file_type) for file_bytes, (_, _, file_type) in zip(_file_contents, file_keys)]
+    
+    if len(files) == 1:
+        file_bytes, file_type = files[0]
+        parsed = [parse_resume(file_bytes, file_type, get_analyzer())]
+    else:
+        # Extraction + analysis in worker processes, one spaCy model each
+        parsed = [None] * len(files)
+        for i, parsed_data in parse_resumes_parallel(files):
+            parsed[i] = parsed_data
+    
+    parsed_results = []
+    failed = []
+    for (file_name, _, _), parsed_data in zip(file_keys, parsed):
+        if parsed_data is None:
+            failed.append(file_name)
+        else:
+            parsed_results.append((file_name, parsed_data))
+    return parsed_results, failed
+
+
+def select_parsed_resume():
+    """Let the user pick which parsed resume to show when several were uploaded."""
+    results = st.session_state.parsed_results
+    if len(results) > 1:
+        st.selectbox(
+            "Resume",
+            options=range(len(results)),
+            format_func=lambda i: results[i][0],
+            key="selected_resume"
+        )
+
+
+def selected_parsed_data() -> Optional[Dict]:
+    """Parsed data of the currently selected resume, or None if nothing was parsed."""
+    results = st.session_state.parsed_results
+    if not results:
+        return None
+    index = st.session_state.get('selected_resume', 0)
+    return results[index if index < len(results) else 0][1]
+
+
 def main():
     """Main application function."""
     
@@ -82,24 +176,7 @@ def main():
     with st.sidebar:
         st.header("⚙️ Options")
         
-        st.subheader("About")
-        st.info("""
-        **ResumeFit** extracts:
-        - 👤 Personal Information
-        - 💼 Skills
-        - 🎓 Education
-        - 💻 Work Experience
-        
-        **Supported formats:** PDF, DOCX
-        """)
-        
-        st.subheader("Instructions")
-        st.markdown("""
-        1. Upload a resume file
-        2. Wait for processing
-        3. View extracted data
-        4. Download results
-        """)
+        st.markdown(SIDEBAR_MARKDOWN)
     
     # Main content
     tab1, tab2, tab3 = st.tabs(["📤 Upload & Parse", "📊 Results", "💾 Export"])
@@ -107,22 +184,31 @@ def main():
     with tab1:
         st.header("Upload Resume")
         
-        uploaded_file = st.file_uploader(
-            "Choose a resume file",
+        uploaded_files = st.file_uploader(
+            "Choose resume files",
             type=['pdf', 'docx'],
-            help="Upload a PDF or DOCX resume file"
+            accept_multiple_files=True,
+            help="Upload one or more PDF or DOCX resume files"
         )
         
-        if uploaded_file is not None:
+        if uploaded_files:
             # Display file info
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("File Name", uploaded_file.name)
-            with col2:
-                st.metric("File Size", f"{uploaded_file.size / 1024:.2f} KB")
-            with col3:
-                file_type = uploaded_file.name.split('.')[-1].upper()
-                st.metric("File Type", file_type)
+            if len(uploaded_files) == 1:
+                uploaded_file = uploaded_files[0]
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("File Name", uploaded_file.name)
+                with col2:
+                    st.metric("File Size", f"{uploaded_file.size / 1024:.2f} KB")
+                with col3:
+                    st.metric("File Type", file_extension(uploaded_file.name).upper())
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Files", len(uploaded_files))
+                with col2:
+                    total_size = sum(f.size for f in uploaded_files)
+                    st.metric("Total Size", f"{total_size / 1024:.2f} KB")
             
             st.divider()
             
@@ -130,34 +216,23 @@ def main():
             if st.button("🔍 Parse Resume", type="primary", use_container_width=True):
                 with st.spinner("Extracting and analyzing resume..."):
                     try:
-                        # Step 1: Extract text
-                        st.info("Step 1/4: Extracting text from file...")
-                        file_type = uploaded_file.name.split('.')[-1].lower()
-                        text = extract_text(uploaded_file, file_type)
-                        
-                        if not text:
-                            st.error("Failed to extract text from the file. Please check the file format.")
-                            st.stop()
-                        
-                        # Step 2: Preprocess
-                        st.info("Step 2/4: Preprocessing text...")
-                        preprocessed = preprocess_resume_text(text)
-                        
-                        # Step 3: Analyze
-                        st.info("Step 3/4: Analyzing resume content...")
-                        parsed_data = st.session_state.analyzer.analyze(
-                            preprocessed['cleaned_text'],
-                            preprocessed['sections']
+                        # Read each upload once and pass the bytes downstream
+                        file_contents = [f.getvalue() for f in uploaded_files]
+                        file_keys = tuple(
+                            (f.name, file_hash(file_bytes), file_extension(f.name))
+                            for f, file_bytes in zip(uploaded_files, file_contents)
                         )
+                        parsed_results, failed = parse_resumes(file_keys, file_contents)
+                        
+                        for file_name in failed:
+                            st.error(f"Failed to extract text from {file_name}. Please check the file format.")
                         
-                        # Add contact info to parsed data
-                        parsed_data['contact_info'] = preprocessed['contact_info']
+                        if not parsed_results:
+                            st.stop()
                         
-                        # Step 4: Complete
-                        st.info("Step 4/4: Finalizing results...")
-                        st.session_state.parsed_data = parsed_data
+                        st.session_state.parsed_results = parsed_results
                         
-                        st.success("✅ Resume parsed successfully!")
+                        st.success(f"✅ Parsed {len(parsed_results)} resume(s) successfully!")
                         st.balloons()
                         
                     except Exception as e:
@@ -167,10 +242,11 @@ def main():
     with tab2:
         st.header("Parsed Results")
         
-        if st.session_state.parsed_data is None:
+        if not st.session_state.parsed_results:
             st.info("👆 Please upload and parse a resume first.")
         else:
-            data = st.session_state.parsed_data
+            select_parsed_resume()
+            data = selected_parsed_data()
             
             # Summary statistics
             st.subheader("📈 Summary")
@@ -237,7 +313,7 @@ def main():
                 st.subheader("💼 Skills")
                 if data.get('skills'):
                     # Display as tags
-                    skills_html = " ".join([f'<span style="background-color: #e0e0e0; padding: 0.3rem 0.6rem; margin: 0.2rem; border-radius: 0.3rem; display: inline-block;">{skill}</span>' for skill in data['skills']])
+                    skills_html = " ".join(SKILL_TAG.format(skill) for skill in data['skills'])
                     st.markdown(skills_html, unsafe_allow_html=True)
                 else:
                     st.info("No skills found")
@@ -271,11 +347,10 @@ def main():
     with tab3:
         st.header("Export Data")
         
-        if st.session_state.parsed_data is None:
+        data = selected_parsed_data()
+        if data is None:
             st.info("👆 Please upload and parse a resume first.")
         else:
-            data = st.session_state.parsed_data
-            
             col1, col2 = st.columns(2)
             
             with col1:
@@ -283,7 +358,7 @@ def main():
                 st.write("Export as structured JSON file")
                 
                 # Create JSON download
-                json_str = json.dumps(data, indent=2, ensure_ascii=False)
+                json_str = to_json(data)
                 st.download_button(
                     label="⬇️ Download JSON",
                     data=json_str,
@@ -3,10 +3,7 @@ ResumeFit Parser Module
 A comprehensive resume parsing library for extracting structured information from resumes.
 """
 
-from .extractor import extract_text_from_pdf, extract_text_from_docx
-from .preprocessor import clean_text, preprocess_resume_text
-from .analyzer import ResumeAnalyzer
-from .exporter import export_to_json, export_to_csv
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -17,4 +14,35 @@ __all__ = [
     "ResumeAnalyzer",
     "export_to_json",
     "export_to_csv",
+    "export_to_csv_stream",
+    "parse_resume",
+    "parse_resumes_parallel",
 ]
+
+# Public name -> submodule. Submodules pull in spaCy, PyMuPDF and friends, so
+# they are only imported when one of their names is first accessed (PEP 562).
+_LAZY_EXPORTS = {
+    "extract_text_from_pdf": ".extractor",
+    "extract_text_from_docx": ".extractor",
+    "clean_text": ".preprocessor",
+    "preprocess_resume_text": ".preprocessor",
+    "ResumeAnalyzer": ".analyzer",
+    "export_to_json": ".exporter",
+    "export_to_csv": ".exporter",
+    "export_to_csv_stream": ".exporter",
+    "parse_resume": ".batch",
+    "parse_resumes_parallel": ".batch",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
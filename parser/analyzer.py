@@ -3,28 +3,115 @@ Resume Analyzer Module
 Extracts structured information (skills, education, experience) using spaCy and regex.
 """
 
+import os
 import re
+import hashlib
+import functools
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
 import spacy
-from typing import Dict, List, Optional
+from spacy.tokens import DocBin
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Only NER is consumed (name extraction); en_core_web_sm's ner component has its
+# own internal tok2vec, so the rest of the pipeline can be skipped.
+_UNUSED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# Documents per nlp.pipe batch in analyze_many
+_SPACY_BATCH_SIZE = int(os.environ.get("RESUMEFIT_SPACY_BATCH_SIZE", "64"))
+
+# spaCy worker processes for analyze_many. Unset means automatic: one process
+# for small batches (spawning workers and copying the model costs more than it
+# saves), all cores from _MULTIPROCESS_MIN_DOCS documents up.
+_NLP_N_PROCESS: Optional[int] = (int(os.environ["RESUMEFIT_NLP_NPROCESS"])
+                                  if os.environ.get("RESUMEFIT_NLP_NPROCESS") else None)
+_MULTIPROCESS_MIN_DOCS = 64
+
+# Optional on-disk cache of NER results (DocBin files keyed by model + text),
+# for repeated runs over the same resumes. Disabled unless set.
+_DOC_CACHE_DIR = os.environ.get("RESUMEFIT_DOC_CACHE_DIR")
+
+# Document heads whose NER result each analyzer keeps in memory
+_NER_CACHE_SIZE = 64
+
+# A run of word characters, i.e. one candidate single-word skill
+_WORD_RE = re.compile(r'\w+')
+
+# Lines containing these are contact details, not a name
+_NOT_NAME_RE = re.compile(r'@|http|www|\d{3}[-.]?\d{3}[-.]?\d{4}')
+
+# Common degree patterns (bachelor, master, doctorate, associate, diploma)
+_DEGREE_RE = re.compile(
+    r'(?:bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)'
+    r'|(?:master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)'
+    r'|(?:phd|ph\.?d\.?|doctorate)'
+    r'|(?:associate|a\.?s\.?|a\.?a\.?)'
+    r'|(?:diploma|certificate)'
+)
+
+# Fields of study
+_FIELDS_RE = re.compile(r'(?:computer science|engineering|business|arts|science|mathematics|physics|chemistry|biology|economics|finance|marketing|management)')
+
+_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+
+# Month + year or a bare year
+_DATE_PATTERN = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4}|(?:19|20)\d{2}'
+_DATE_RE = re.compile(_DATE_PATTERN, re.IGNORECASE)
+# Case-sensitive, as used to decide whether a line is a company name or
+# description ('Junction 1500 Ltd' is not a date there)
+_DATE_CHECK_RE = re.compile(_DATE_PATTERN)
+
+# Common job title keywords
+_JOB_TITLES = [
+    'engineer', 'developer', 'programmer', 'analyst', 'scientist',
+    'manager', 'director', 'consultant', 'specialist', 'architect',
+    'lead', 'senior', 'junior', 'intern', 'associate', 'coordinator'
+]
+
+# Any job title keyword, anywhere in a line. No word boundaries, so plurals
+# and compounds ('Engineers', 'Team Lead/Manager') still count.
+_JOB_TITLE_RE = re.compile('|'.join(re.escape(title) for title in _JOB_TITLES))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_nlp(model_name: str = "en_core_web_sm"):
+    """
+    Load a spaCy model once per process (NER only).
+    
+    Args:
+        model_name: Name of the installed spaCy model
+        
+    Returns:
+        Shared spaCy Language object
+    """
+    try:
+        nlp = spacy.load(model_name, disable=_UNUSED_PIPES)
+        logger.info(f"Loaded spaCy model {model_name} successfully")
+    except OSError:
+        logger.error(f"spaCy model not found. Please run: python -m spacy download {model_name}")
+        raise
+    return nlp
+
 
 class ResumeAnalyzer:
     """
     Main class for analyzing and extracting structured information from resumes.
     """
     
-    def __init__(self):
-        """Initialize the analyzer with spaCy model."""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model successfully")
-        except OSError:
-            logger.error("spaCy model not found. Please run: python -m spacy download en_core_web_sm")
-            raise
+    def __init__(self, model_name: str = "en_core_web_sm"):
+        """
+        Initialize the analyzer with a shared spaCy model (NER only).
+        
+        Args:
+            model_name: Name of the installed spaCy model
+        """
+        self.nlp = _load_nlp(model_name)
         
         # Common skills database (can be expanded)
         self.common_skills = {
@@ -44,39 +131,164 @@ class ResumeAnalyzer:
                           'critical thinking', 'time management', 'agile', 'scrum']
         }
         
+        # Tokenizer + NER only, called directly rather than through the
+        # pipeline. Recently processed document heads are cached (the app
+        # shares one analyzer between sessions, hence the lock), so
+        # re-analyzing the same resume skips the NER pass.
+        self._ner = self.nlp.get_pipe("ner")
+        self._recent_docs = OrderedDict()
+        self._recent_docs_lock = threading.Lock()
+        
         # Flatten skills for easy searching
         self.all_skills = []
         for category, skills in self.common_skills.items():
             self.all_skills.extend(skills)
+        
+        # Lowercase skill -> display form. Single-word skills are found with a
+        # set intersection against the text's \w+ tokens. The few skills with
+        # spaces or symbols ('c++', 'rest api', 'ci/cd') need a regex: one
+        # alternation, longest first, where a skill must not touch a word
+        # character on either side (unlike \b this works for 'c++' and 'c#').
+        self._skill_titles = {skill.lower(): skill.title() for skill in self.all_skills}
+        self._skill_words = frozenset(skill for skill in self._skill_titles
+                                      if _WORD_RE.fullmatch(skill))
+        self._skill_re = re.compile(
+            r'(?<!\w)(?:'
+            + '|'.join(re.escape(skill)
+                       for skill in sorted(self._skill_titles.keys() - self._skill_words,
+                                           key=len, reverse=True))
+            + r')(?!\w)'
+        )
     
-    def extract_name(self, text: str) -> Optional[str]:
+    def _name_from_lines(self, text: str) -> Optional[str]:
         """
-        Extract candidate name from resume text.
-        Usually the first line or first PERSON entity.
+        Cheap name heuristic: the first short line that isn't contact info.
         
         Args:
             text: Resume text
             
         Returns:
-            Extracted name or None
+            Candidate name or None
         """
-        # Try to get from first few lines
-        lines = text.split('\n')
-        for line in lines[:5]:
+        # Only the first five lines are inspected, so don't split the whole text
+        for line in text.split('\n', 5)[:5]:
             line = line.strip()
             if line and len(line.split()) <= 4 and len(line) < 50:
                 # Check if it looks like a name (not email, phone, etc.)
-                if not re.search(r'@|http|www|\d{3}[-.]?\d{3}[-.]?\d{4}', line.lower()):
+                if not _NOT_NAME_RE.search(line.lower()):
                     return line
+        return None
+    
+    def _doc_cache_path(self, text: str) -> Path:
+        """On-disk cache file for text under RESUMEFIT_DOC_CACHE_DIR."""
+        # Keyed by model as well as text, so a model upgrade never reuses stale entities
+        key = f"{self.nlp.meta.get('name')}-{self.nlp.meta.get('version')}\0{text}"
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(_DOC_CACHE_DIR) / f"{digest}.spacy"
+    
+    def _remember_doc(self, text: str, doc):
+        """Add a Doc to the in-memory cache, evicting the least recently used."""
+        with self._recent_docs_lock:
+            self._recent_docs[text] = doc
+            self._recent_docs.move_to_end(text)
+            if len(self._recent_docs) > _NER_CACHE_SIZE:
+                self._recent_docs.popitem(last=False)
+    
+    def _cached_doc(self, text: str):
+        """
+        Look up an already processed text, in memory first and then in the
+        on-disk cache when RESUMEFIT_DOC_CACHE_DIR is set.
         
-        # Try using spaCy NER
-        doc = self.nlp(text[:500])  # Process first 500 chars
+        Args:
+            text: Text to look up
+            
+        Returns:
+            Cached spaCy Doc, or None if the text has not been processed
+        """
+        with self._recent_docs_lock:
+            doc = self._recent_docs.get(text)
+            if doc is not None:
+                self._recent_docs.move_to_end(text)
+                return doc
+        
+        if _DOC_CACHE_DIR:
+            cache_path = self._doc_cache_path(text)
+            if cache_path.exists():
+                try:
+                    doc = next(DocBin().from_disk(cache_path).get_docs(self.nlp.vocab))
+                except Exception as e:
+                    # Unreadable entry: drop it and let the caller run NER again
+                    logger.warning(f"Discarding unreadable Doc cache file {cache_path}: {str(e)}")
+                    cache_path.unlink(missing_ok=True)
+                    return None
+                self._remember_doc(text, doc)
+        return doc
+    
+    def _store_doc(self, text: str, doc):
+        """Cache a freshly processed Doc in memory and, if enabled, on disk."""
+        if _DOC_CACHE_DIR:
+            cache_path = self._doc_cache_path(text)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file and rename it into place, so other
+                # worker processes sharing the directory never see a partial file
+                fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(DocBin(docs=[doc]).to_bytes())
+                    os.replace(tmp_name, cache_path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+            except OSError as e:
+                logger.warning(f"Could not write Doc cache file {cache_path}: {str(e)}")
+        self._remember_doc(text, doc)
+    
+    def _nlp_doc(self, text: str):
+        """
+        Tokenize text and run only the NER component on it, reusing a cached
+        result when there is one.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            Processed spaCy Doc
+        """
+        doc = self._cached_doc(text)
+        if doc is None:
+            doc = self._ner(self.nlp.make_doc(text))
+            self._store_doc(text, doc)
+        return doc
+    
+    @staticmethod
+    def _name_from_doc(doc) -> Optional[str]:
+        """Return the first PERSON entity of a processed spaCy Doc."""
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 return ent.text
-        
         return None
     
+    def extract_name(self, text: str) -> Optional[str]:
+        """
+        Extract candidate name from resume text.
+        Usually the first line or first PERSON entity.
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            Extracted name or None
+        """
+        # Try to get from first few lines
+        name = self._name_from_lines(text)
+        if name:
+            return name
+        
+        # Try using spaCy NER
+        doc = self._nlp_doc(text[:500])  # Process first 500 chars
+        return self._name_from_doc(doc)
+    
     def extract_skills(self, text: str) -> List[str]:
         """
         Extract skills from resume text using pattern matching.
@@ -87,19 +299,14 @@ class ResumeAnalyzer:
         Returns:
             List of identified skills
         """
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Search for each skill in the text
-        for skill in self.all_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                # Preserve original capitalization of skill
-                found_skills.append(skill.title())
-        
-        # Remove duplicates and sort
-        found_skills = sorted(list(set(found_skills)))
+        return self._extract_skills(text.lower())
+    
+    def _extract_skills(self, text_lower: str) -> List[str]:
+        """extract_skills on already lowercased text."""
+        # Preserve original capitalization of skill, remove duplicates and sort
+        found = (self._skill_words.intersection(_WORD_RE.findall(text_lower))
+                 .union(self._skill_re.findall(text_lower)))
+        found_skills = sorted({self._skill_titles[skill] for skill in found})
         
         logger.info(f"Extracted {len(found_skills)} skills")
         return found_skills
@@ -114,55 +321,47 @@ class ResumeAnalyzer:
         Returns:
             List of education entries
         """
+        return self._extract_education(text.split('\n'), text.lower().split('\n'))
+    
+    def _extract_education(self, lines: List[str], lines_lower: List[str]) -> List[Dict[str, str]]:
+        """extract_education on text already split into original and lowercased lines."""
         education = []
         
-        # Common degree patterns
-        degree_patterns = [
-            r'(?:bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)',
-            r'(?:master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)',
-            r'(?:phd|ph\.?d\.?|doctorate)',
-            r'(?:associate|a\.?s\.?|a\.?a\.?)',
-            r'(?:diploma|certificate)'
-        ]
-        
-        # Fields of study
-        fields_pattern = r'(?:computer science|engineering|business|arts|science|mathematics|physics|chemistry|biology|economics|finance|marketing|management)'
-        
-        lines = text.split('\n')
+        # First year on each line (or None), scanned once up front
+        line_years = [year_match.group(0) if year_match else None
+                      for year_match in map(_YEAR_RE.search, lines)]
         
         for i, line in enumerate(lines):
-            line_lower = line.lower()
+            line_lower = lines_lower[i]
             
             # Check if line contains degree information
-            for degree_pattern in degree_patterns:
-                if re.search(degree_pattern, line_lower):
-                    entry = {'degree': line.strip()}
-                    
-                    # Try to find field of study
-                    field_match = re.search(fields_pattern, line_lower)
-                    if field_match:
-                        entry['field'] = field_match.group(0).title()
-                    
-                    # Try to find year (look in current and next few lines)
-                    year_pattern = r'(?:19|20)\d{2}'
-                    for j in range(i, min(i+3, len(lines))):
-                        year_match = re.search(year_pattern, lines[j])
-                        if year_match:
-                            entry['year'] = year_match.group(0)
-                            break
-                    
-                    # Try to find university/institution
-                    if i > 0:
-                        prev_line = lines[i-1].strip()
-                        if prev_line and len(prev_line) > 5:
-                            entry['institution'] = prev_line
-                    elif i < len(lines) - 1:
-                        next_line = lines[i+1].strip()
-                        if next_line and len(next_line) > 5 and not re.search(year_pattern, next_line):
-                            entry['institution'] = next_line
-                    
-                    education.append(entry)
+            if not _DEGREE_RE.search(line_lower):
+                continue
+            
+            entry = {'degree': line.strip()}
+            
+            # Try to find field of study
+            field_match = _FIELDS_RE.search(line_lower)
+            if field_match:
+                entry['field'] = field_match.group(0).title()
+            
+            # Try to find year (look in current and next few lines)
+            for j in range(i, min(i+3, len(lines))):
+                if line_years[j]:
+                    entry['year'] = line_years[j]
                     break
+            
+            # Try to find university/institution
+            if i > 0:
+                prev_line = lines[i-1].strip()
+                if prev_line and len(prev_line) > 5:
+                    entry['institution'] = prev_line
+            elif i < len(lines) - 1:
+                next_line = lines[i+1].strip()
+                if next_line and len(next_line) > 5 and not line_years[i+1]:
+                    entry['institution'] = next_line
+            
+            education.append(entry)
         
         logger.info(f"Extracted {len(education)} education entries")
         return education
@@ -177,105 +376,165 @@ class ResumeAnalyzer:
         Returns:
             List of experience entries
         """
+        return self._extract_experience(text.split('\n'), text.lower().split('\n'))
+    
+    def _extract_experience(self, lines: List[str], lines_lower: List[str]) -> List[Dict[str, str]]:
+        """extract_experience on text already split into original and lowercased lines."""
         experiences = []
         
-        # Common job title keywords
-        job_titles = [
-            'engineer', 'developer', 'programmer', 'analyst', 'scientist',
-            'manager', 'director', 'consultant', 'specialist', 'architect',
-            'lead', 'senior', 'junior', 'intern', 'associate', 'coordinator'
-        ]
+        # Dates on each line, scanned at most once and only for lines near a
+        # job title (most lines never need it)
+        line_dates = [None] * len(lines)
         
-        # Date patterns
-        date_pattern = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4}|(?:19|20)\d{2}'
-        
-        lines = text.split('\n')
+        def dates_on(k: int) -> List[str]:
+            if line_dates[k] is None:
+                line_dates[k] = _DATE_RE.findall(lines[k])
+            return line_dates[k]
         
         for i, line in enumerate(lines):
-            line_lower = line.lower()
+            line_lower = lines_lower[i]
             
             # Check if line contains job title
-            for title in job_titles:
-                if title in line_lower:
-                    entry = {'title': line.strip()}
-                    
-                    # Try to find dates (look in current and next few lines)
-                    dates = []
-                    for j in range(max(0, i-1), min(i+3, len(lines))):
-                        date_matches = re.findall(date_pattern, lines[j], re.IGNORECASE)
-                        dates.extend(date_matches)
-                    
-                    if len(dates) >= 2:
-                        entry['start_date'] = dates[0]
-                        entry['end_date'] = dates[1]
-                    elif len(dates) == 1:
-                        entry['date'] = dates[0]
-                    
-                    # Try to find company (usually before or after title)
-                    if i > 0:
-                        prev_line = lines[i-1].strip()
-                        if prev_line and len(prev_line) > 3 and not re.search(date_pattern, prev_line):
-                            entry['company'] = prev_line
-                    elif i < len(lines) - 1:
-                        next_line = lines[i+1].strip()
-                        if next_line and len(next_line) > 3 and not re.search(date_pattern, next_line):
-                            entry['company'] = next_line
-                    
-                    # Collect description (next few lines until empty line or new section)
-                    description_lines = []
-                    for j in range(i+1, min(i+10, len(lines))):
-                        desc_line = lines[j].strip()
-                        if not desc_line or any(keyword in desc_line.lower() for keyword in job_titles):
-                            break
-                        if not re.search(date_pattern, desc_line):
-                            description_lines.append(desc_line)
-                    
-                    if description_lines:
-                        entry['description'] = ' '.join(description_lines)
-                    
-                    experiences.append(entry)
+            if not _JOB_TITLE_RE.search(line_lower):
+                continue
+            
+            entry = {'title': line.strip()}
+            
+            # Try to find dates (look in current and next few lines)
+            dates = []
+            for j in range(max(0, i-1), min(i+3, len(lines))):
+                dates.extend(dates_on(j))
+            
+            if len(dates) >= 2:
+                entry['start_date'] = dates[0]
+                entry['end_date'] = dates[1]
+            elif len(dates) == 1:
+                entry['date'] = dates[0]
+            
+            # Try to find company (usually before or after title)
+            if i > 0:
+                prev_line = lines[i-1].strip()
+                if prev_line and len(prev_line) > 3 and not _DATE_CHECK_RE.search(prev_line):
+                    entry['company'] = prev_line
+            elif i < len(lines) - 1:
+                next_line = lines[i+1].strip()
+                if next_line and len(next_line) > 3 and not _DATE_CHECK_RE.search(next_line):
+                    entry['company'] = next_line
+            
+            # Collect description (next few lines until empty line or new section)
+            description_lines = []
+            for j in range(i+1, min(i+10, len(lines))):
+                desc_line = lines[j].strip()
+                if not desc_line or _JOB_TITLE_RE.search(lines_lower[j]):
                     break
+                if not _DATE_CHECK_RE.search(desc_line):
+                    description_lines.append(desc_line)
+            
+            if description_lines:
+                entry['description'] = ' '.join(description_lines)
+            
+            experiences.append(entry)
         
         logger.info(f"Extracted {len(experiences)} experience entries")
         return experiences
     
-    def analyze(self, text: str, sections: Optional[Dict[str, str]] = None) -> Dict[str, any]:
+    def _analyze_sections(self, text: str, sections: Optional[Dict[str, str]],
+                          name: Optional[str],
+                          contact_info: Optional[Dict[str, str]] = None) -> Dict[str, any]:
+        """Build the result dict once the candidate name is known."""
+        result = {
+            'name': name,
+            'skills': [],
+            'education': [],
+            'experience': [],
+            'contact_info': contact_info or {}
+        }
+        
+        # Use the matching section when present, otherwise the full text
+        skills_text = sections['skills'] if sections and 'skills' in sections else text
+        education_text = sections['education'] if sections and 'education' in sections else text
+        experience_text = sections['experience'] if sections and 'experience' in sections else text
+        
+        # Lowercase each distinct source once, not once per extractor
+        lowered = {source: source.lower()
+                   for source in {skills_text, education_text, experience_text}}
+        
+        # Likewise split each line-based source once (neither extractor mutates it)
+        split = {source: (source.split('\n'), lowered[source].split('\n'))
+                 for source in {education_text, experience_text}}
+        
+        result['skills'] = self._extract_skills(lowered[skills_text])
+        result['education'] = self._extract_education(*split[education_text])
+        result['experience'] = self._extract_experience(*split[experience_text])
+        
+        return result
+    
+    def analyze(self, text: str, sections: Optional[Dict[str, str]] = None,
+                contact_info: Optional[Dict[str, str]] = None) -> Dict[str, any]:
         """
         Main analysis function that extracts all information from resume.
         
         Args:
             text: Resume text
             sections: Pre-extracted sections (optional)
+            contact_info: Pre-extracted contact details to include (optional)
             
         Returns:
             Dictionary containing all extracted information
         """
-        logger.info("Starting resume analysis")
+        return self.analyze_many([(text, sections, contact_info)])[0]
+    
+    def analyze_many(self, texts_and_sections: Iterable[Tuple],
+                     batch_size: int = _SPACY_BATCH_SIZE,
+                     n_process: Optional[int] = None) -> List[Dict[str, any]]:
+        """
+        Analyze several resumes, batching the spaCy NER fallback through nlp.pipe.
         
-        result = {
-            'name': self.extract_name(text),
-            'skills': [],
-            'education': [],
-            'experience': []
-        }
+        Args:
+            texts_and_sections: Iterable of (text, sections) pairs, or
+                (text, sections, contact_info) triples
+            batch_size: Number of documents per spaCy batch
+                (default from RESUMEFIT_SPACY_BATCH_SIZE, else 64)
+            n_process: Number of spaCy worker processes (-1 for all cores;
+                default from RESUMEFIT_NLP_NPROCESS, else chosen by batch size)
+            
+        Returns:
+            List of result dictionaries, in input order
+        """
+        items = list(texts_and_sections)
+        logger.info(f"Starting batch analysis of {len(items)} resumes")
         
-        # Extract skills from full text or skills section
-        if sections and 'skills' in sections:
-            result['skills'] = self.extract_skills(sections['skills'])
-        else:
-            result['skills'] = self.extract_skills(text)
-        
-        # Extract education from education section or full text
-        if sections and 'education' in sections:
-            result['education'] = self.extract_education(sections['education'])
-        else:
-            result['education'] = self.extract_education(text)
-        
-        # Extract experience from experience section or full text
-        if sections and 'experience' in sections:
-            result['experience'] = self.extract_experience(sections['experience'])
-        else:
-            result['experience'] = self.extract_experience(text)
-        
-        logger.info("Completed resume analysis")
-        return result
+        names = [self._name_from_lines(item[0]) for item in items]
+        
+        # Only resumes where the line heuristic failed need NER
+        pending = [i for i, name in enumerate(names) if not name]
+        if pending:
+            heads = [items[i][0][:500] for i in pending]
+            
+            # Reuse cached NER results; only the misses go through spaCy
+            docs = [self._cached_doc(head) for head in heads]
+            misses = [j for j, doc in enumerate(docs) if doc is None]
+            if len(misses) == 1:
+                # Nothing to batch
+                docs[misses[0]] = self._nlp_doc(heads[misses[0]])
+            elif misses:
+                if n_process is None:
+                    if _NLP_N_PROCESS is not None:
+                        n_process = _NLP_N_PROCESS
+                    else:
+                        n_process = -1 if len(misses) >= _MULTIPROCESS_MIN_DOCS else 1
+                piped = self.nlp.pipe([heads[j] for j in misses],
+                                      batch_size=batch_size, n_process=n_process)
+                for j, doc in zip(misses, piped):
+                    docs[j] = doc
+                    self._store_doc(heads[j], doc)
+            
+            for i, doc in zip(pending, docs):
+                names[i] = self._name_from_doc(doc)
+        
+        results = [self._analyze_sections(item[0], item[1], name,
+                                          item[2] if len(item) > 2 else None)
+                   for item, name in zip(items, names)]
+        
+        logger.info("Completed batch analysis")
+        return results
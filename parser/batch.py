@@ -0,0 +1,78 @@
+"""
+Batch Parsing Module
+Parses many resumes in parallel, one worker process per CPU core.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+from .extractor import extract_text
+from .preprocessor import preprocess_resume_text
+from .analyzer import ResumeAnalyzer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Per-process analyzer, loaded once by the pool initializer
+_worker_analyzer: Optional[ResumeAnalyzer] = None
+
+
+def parse_resume(file_content, file_type: str, analyzer: ResumeAnalyzer) -> Optional[Dict]:
+    """
+    Run the full pipeline (extract -> preprocess -> analyze) on one resume.
+    
+    Args:
+        file_content: Path, raw bytes or file-like object
+        file_type: Type of file ('pdf' or 'docx')
+        analyzer: ResumeAnalyzer to use
+    
+    Returns:
+        Parsed resume data, or None if no text could be extracted
+    """
+    text = extract_text(file_content, file_type)
+    if not text:
+        return None
+    
+    preprocessed = preprocess_resume_text(text)
+    return analyzer.analyze(preprocessed['cleaned_text'], preprocessed['sections'],
+                            contact_info=preprocessed['contact_info'])
+
+
+def _init_worker():
+    """Load the spaCy model once per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer()
+
+
+def _parse_one(file_bytes: bytes, file_type: str) -> Optional[Dict]:
+    """Worker entry point: parse one uploaded file."""
+    return parse_resume(file_bytes, file_type, _worker_analyzer)
+
+
+def parse_resumes_parallel(files: List[Tuple[bytes, str]],
+                           max_workers: Optional[int] = None) -> Iterator[Tuple[int, Optional[Dict]]]:
+    """
+    Parse several resumes across worker processes.
+    
+    Args:
+        files: List of (file bytes, file type) pairs
+        max_workers: Number of worker processes (defaults to CPU count)
+    
+    Yields:
+        (index into ``files``, parsed data or None) as each resume finishes
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(files)))
+    
+    logger.info(f"Parsing {len(files)} resumes with {max_workers} workers")
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(_parse_one, file_bytes, file_type): i
+            for i, (file_bytes, file_type) in enumerate(files)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
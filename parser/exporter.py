@@ -3,9 +3,10 @@ Export Module
 Handles exporting parsed resume data to JSON and CSV formats.
 """
 
+import csv
+import io
 import json
-import pandas as pd
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, TextIO
 from datetime import datetime
 import os
 import logging
@@ -13,6 +14,84 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Static parts of the display report, built once
+_BANNER = "=" * 60
+_REPORT_HEADER = f"{_BANNER}\nRESUME ANALYSIS RESULTS\n{_BANNER}\n\n"
+
+
+def _json_bytes(data: Dict) -> bytes:
+    """
+    Serialize parsed resume data to indented UTF-8 JSON.
+    Uses orjson when installed, otherwise the standard library.
+    
+    Args:
+        data: Dictionary containing parsed resume data
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def to_json(data: Dict) -> str:
+    """
+    Serialize parsed resume data to an indented JSON string.
+    
+    Args:
+        data: Dictionary containing parsed resume data
+        
+    Returns:
+        JSON string
+    """
+    return _json_bytes(data).decode('utf-8')
+
+
+def _write_csv(filepath: str, rows: List[Dict]) -> None:
+    """
+    Write a list of dicts as CSV, one column per key (in first-seen order).
+    
+    Args:
+        filepath: Destination path
+        rows: Rows to write; missing keys are left empty
+    """
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# Columns of the one-row-per-resume summary CSV
+_SUMMARY_FIELDS = ['Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 'Skills']
+
+
+def _summary_row(data: Dict) -> Dict:
+    """
+    One-row summary of a parsed resume (name, contact details, skills).
+    
+    Args:
+        data: Dictionary containing parsed resume data
+        
+    Returns:
+        Row keyed by column name
+    """
+    contact = data.get('contact_info', {})
+    return {
+        'Name': data.get('name', 'N/A'),
+        'Email': contact.get('email', 'N/A'),
+        'Phone': contact.get('phone', 'N/A'),
+        'LinkedIn': contact.get('linkedin', 'N/A'),
+        'GitHub': contact.get('github', 'N/A'),
+        'Skills': ', '.join(data.get('skills', [])),
+    }
+
 
 def export_to_json(data: Dict, output_path: str = None, filename: str = None) -> str:
     """
@@ -41,8 +120,9 @@ def export_to_json(data: Dict, output_path: str = None, filename: str = None) ->
     filepath = os.path.join(output_path, filename)
     
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson already produces UTF-8 bytes; write them as-is
+        with open(filepath, 'wb') as f:
+            f.write(_json_bytes(data))
         
         logger.info(f"Successfully exported to JSON: {filepath}")
         return filepath
@@ -78,31 +158,20 @@ def export_to_csv(data: Dict, output_path: str = None, filename: str = None) ->
     
     try:
         # Main info CSV
-        main_info = {
-            'Name': [data.get('name', 'N/A')],
-            'Email': [data.get('contact_info', {}).get('email', 'N/A')],
-            'Phone': [data.get('contact_info', {}).get('phone', 'N/A')],
-            'LinkedIn': [data.get('contact_info', {}).get('linkedin', 'N/A')],
-            'GitHub': [data.get('contact_info', {}).get('github', 'N/A')],
-            'Skills': [', '.join(data.get('skills', []))],
-        }
-        main_df = pd.DataFrame(main_info)
         main_filepath = os.path.join(output_path, f"{filename}_main.csv")
-        main_df.to_csv(main_filepath, index=False, encoding='utf-8')
+        _write_csv(main_filepath, [_summary_row(data)])
         logger.info(f"Exported main info to: {main_filepath}")
         
         # Education CSV
         if data.get('education'):
-            edu_df = pd.DataFrame(data['education'])
             edu_filepath = os.path.join(output_path, f"{filename}_education.csv")
-            edu_df.to_csv(edu_filepath, index=False, encoding='utf-8')
+            _write_csv(edu_filepath, data['education'])
             logger.info(f"Exported education to: {edu_filepath}")
         
         # Experience CSV
         if data.get('experience'):
-            exp_df = pd.DataFrame(data['experience'])
             exp_filepath = os.path.join(output_path, f"{filename}_experience.csv")
-            exp_df.to_csv(exp_filepath, index=False, encoding='utf-8')
+            _write_csv(exp_filepath, data['experience'])
             logger.info(f"Exported experience to: {exp_filepath}")
         
         return main_filepath
@@ -111,82 +180,116 @@ def export_to_csv(data: Dict, output_path: str = None, filename: str = None) ->
         raise
 
 
-def format_for_display(data: Dict) -> str:
+def export_to_csv_stream(parsed_iter: Iterable[Dict], filepath: str) -> str:
+    """
+    Export many parsed resumes to a single CSV, one summary row per resume.
+    Rows are written as they arrive, so a generator of results is never
+    held in memory and the file is opened only once.
+    
+    Args:
+        parsed_iter: Iterable of parsed resume dictionaries
+        filepath: Path of the CSV file to write
+        
+    Returns:
+        Path to the saved CSV file
+    """
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    try:
+        count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=_SUMMARY_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            for data in parsed_iter:
+                writer.writerow(_summary_row(data))
+                count += 1
+        
+        logger.info(f"Exported {count} resumes to CSV: {filepath}")
+        return filepath
+    except Exception as e:
+        logger.error(f"Error exporting to CSV: {str(e)}")
+        raise
+
+
+def format_for_display(data: Dict, out: Optional[TextIO] = None) -> Optional[str]:
     """
     Format parsed data for readable display.
     
     Args:
         data: Dictionary containing parsed resume data
+        out: Text stream to write to (optional)
         
     Returns:
-        Formatted string for display
+        Formatted string for display, or None when written to ``out``
     """
-    output = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
     
     # Header
-    output.append("=" * 60)
-    output.append("RESUME ANALYSIS RESULTS")
-    output.append("=" * 60)
-    output.append("")
+    w(_REPORT_HEADER)
     
     # Name
     if data.get('name'):
-        output.append(f"📋 NAME: {data['name']}")
-        output.append("")
+        w(f"📋 NAME: {data['name']}\n")
+        w("\n")
     
     # Contact Info
     if data.get('contact_info'):
-        output.append("📞 CONTACT INFORMATION:")
+        w("📞 CONTACT INFORMATION:\n")
         contact = data['contact_info']
         if contact.get('email'):
-            output.append(f"  • Email: {contact['email']}")
+            w(f"  • Email: {contact['email']}\n")
         if contact.get('phone'):
-            output.append(f"  • Phone: {contact['phone']}")
+            w(f"  • Phone: {contact['phone']}\n")
         if contact.get('linkedin'):
-            output.append(f"  • LinkedIn: {contact['linkedin']}")
+            w(f"  • LinkedIn: {contact['linkedin']}\n")
         if contact.get('github'):
-            output.append(f"  • GitHub: {contact['github']}")
-        output.append("")
+            w(f"  • GitHub: {contact['github']}\n")
+        w("\n")
     
     # Skills
     if data.get('skills'):
-        output.append(f"💼 SKILLS ({len(data['skills'])} found):")
+        w(f"💼 SKILLS ({len(data['skills'])} found):\n")
         for skill in data['skills']:
-            output.append(f"  • {skill}")
-        output.append("")
+            w(f"  • {skill}\n")
+        w("\n")
     
     # Education
     if data.get('education'):
-        output.append(f"🎓 EDUCATION ({len(data['education'])} entries):")
+        w(f"🎓 EDUCATION ({len(data['education'])} entries):\n")
         for i, edu in enumerate(data['education'], 1):
-            output.append(f"  {i}. {edu.get('degree', 'N/A')}")
+            w(f"  {i}. {edu.get('degree', 'N/A')}\n")
             if edu.get('institution'):
-                output.append(f"     Institution: {edu['institution']}")
+                w(f"     Institution: {edu['institution']}\n")
             if edu.get('field'):
-                output.append(f"     Field: {edu['field']}")
+                w(f"     Field: {edu['field']}\n")
             if edu.get('year'):
-                output.append(f"     Year: {edu['year']}")
-            output.append("")
+                w(f"     Year: {edu['year']}\n")
+            w("\n")
     
     # Experience
     if data.get('experience'):
-        output.append(f"💻 WORK EXPERIENCE ({len(data['experience'])} entries):")
+        w(f"💻 WORK EXPERIENCE ({len(data['experience'])} entries):\n")
         for i, exp in enumerate(data['experience'], 1):
-            output.append(f"  {i}. {exp.get('title', 'N/A')}")
+            w(f"  {i}. {exp.get('title', 'N/A')}\n")
             if exp.get('company'):
-                output.append(f"     Company: {exp['company']}")
+                w(f"     Company: {exp['company']}\n")
             if exp.get('start_date') and exp.get('end_date'):
-                output.append(f"     Duration: {exp['start_date']} - {exp['end_date']}")
+                w(f"     Duration: {exp['start_date']} - {exp['end_date']}\n")
             elif exp.get('date'):
-                output.append(f"     Date: {exp['date']}")
+                w(f"     Date: {exp['date']}\n")
             if exp.get('description'):
                 desc = exp['description'][:200] + "..." if len(exp['description']) > 200 else exp['description']
-                output.append(f"     Description: {desc}")
-            output.append("")
+                w(f"     Description: {desc}\n")
+            w("\n")
     
-    output.append("=" * 60)
+    w(_BANNER)
     
-    return '\n'.join(output)
+    if out is None:
+        return buf.getvalue()
+    return None
 
 
 def create_summary_stats(data: Dict) -> Dict:
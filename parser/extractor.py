@@ -3,8 +3,7 @@ Text Extraction Module
 Extracts text content from PDF and DOCX resume files.
 """
 
-import fitz  # PyMuPDF
-from docx import Document
+import io
 from typing import Optional
 import logging
 
@@ -12,33 +11,57 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _read_bytes(source) -> bytes:
+    """
+    Get the full contents of raw bytes or a file-like object, in memory.
+    
+    Streamlit's UploadedFile is a BytesIO, so getvalue() returns the whole
+    buffer regardless of the current read position.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    return source.read()
+
+
 def extract_text_from_pdf(file_path: str) -> Optional[str]:
     """
     Extract text from a PDF file using PyMuPDF.
     
     Args:
-        file_path: Path to the PDF file or file-like object
+        file_path: Path to the PDF file, raw bytes or file-like object
         
     Returns:
         Extracted text as a string, or None if extraction fails
     """
+    # Imported on first use so DOCX-only callers never load PyMuPDF
+    import fitz  # PyMuPDF
+    
     try:
-        text = ""
-        
-        # Handle both file paths and file-like objects (for Streamlit)
+        # Handle both file paths and in-memory content (for Streamlit)
         if isinstance(file_path, str):
             doc = fitz.open(file_path)
         else:
-            # For file-like objects from Streamlit
-            doc = fitz.open(stream=file_path.read(), filetype="pdf")
+            doc = fitz.open(stream=_read_bytes(file_path), filetype="pdf")
         
+        # Collect pages and join once instead of growing a string per page.
+        # Pages are read sequentially: PyMuPDF documents must not be shared
+        # across threads. Parallelism happens per resume, in worker
+        # processes (see batch.parse_resumes_parallel).
+        pages = []
+        debug = logger.isEnabledFor(logging.DEBUG)
         for page_num, page in enumerate(doc, 1):
-            page_text = page.get_text()
-            text += page_text
-            logger.info(f"Extracted text from page {page_num}")
+            # Text blocks in reading order; keeps multi-column layouts intact
+            blocks = page.get_text("blocks", sort=True)
+            pages.append("\n".join(block[4].strip("\n") for block in blocks if block[6] == 0))
+            if debug:
+                logger.debug(f"Extracted text from page {page_num}")
         
         doc.close()
         
+        text = "\n".join(pages) + "\n"
+        
         if not text.strip():
             logger.warning("No text extracted from PDF")
             return None
@@ -56,18 +79,20 @@ def extract_text_from_docx(file_path: str) -> Optional[str]:
     Extract text from a DOCX file using python-docx.
     
     Args:
-        file_path: Path to the DOCX file or file-like object
+        file_path: Path to the DOCX file, raw bytes or file-like object
         
     Returns:
         Extracted text as a string, or None if extraction fails
     """
+    # Imported on first use so PDF-only callers never load python-docx
+    from docx import Document
+    
     try:
-        # Handle both file paths and file-like objects (for Streamlit)
+        # Handle both file paths and in-memory content (for Streamlit)
         if isinstance(file_path, str):
             doc = Document(file_path)
         else:
-            # For file-like objects from Streamlit
-            doc = Document(file_path)
+            doc = Document(io.BytesIO(_read_bytes(file_path)))
         
         # Extract text from paragraphs
         text = []
@@ -101,7 +126,7 @@ def extract_text(file_path, file_type: str) -> Optional[str]:
     Main function to extract text based on file type.
     
     Args:
-        file_path: Path to the file or file-like object
+        file_path: Path to the file, raw bytes or file-like object
         file_type: Type of file ('pdf' or 'docx')
         
     Returns:
@@ -3,9 +3,91 @@ Text Preprocessing Module
 Cleans and preprocesses extracted resume text for better parsing.
 """
 
+import functools
 import re
 import string
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+class _PrintableTable(dict):
+    """
+    str.translate table that deletes non-printable characters (except whitespace).
+    
+    Code points below _PRESEEDED_LIMIT are filled in at import; anything else
+    is added the first time it is seen, so after warm-up the whole filter runs
+    inside str.translate's C loop. A table over all of Unicode would hold
+    roughly a million entries, mostly for unassigned code points.
+    """
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if char.isprintable() or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+# Latin, Greek, Cyrillic, general punctuation, arrows, bullets and box drawing
+_PRESEEDED_LIMIT = 0x3000
+
+# List bullets become spaces (then collapsed or trimmed with other whitespace)
+_BULLETS = '•●▪■□◦‣→'
+
+_PRINTABLE_TABLE = _PrintableTable()
+for _codepoint in range(_PRESEEDED_LIMIT):
+    _PRINTABLE_TABLE[_codepoint]
+del _codepoint
+_PRINTABLE_TABLE.update(dict.fromkeys(map(ord, _BULLETS), ' '))
+
+# Patterns are compiled once at import time
+_WHITESPACE_RE = re.compile(r'\s+')
+# Runs of whitespace other than newlines (spaces, tabs, carriage returns, ...)
+_HSPACE_RE = re.compile(r'[^\S\n]+')
+# Spaces left at either end of a line once horizontal whitespace is collapsed
+_LINE_EDGE_RE = re.compile(r' *\n *')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+# A single character class rather than a repeated alternation of classes, so
+# matching a long URL never backtracks ('%XX' escapes are covered by '$-_')
+_URL_RE = re.compile(r'https?://[a-zA-Z0-9$-_@.&+!*\\(),]+')
+
+# Common section headers (case-insensitive)
+_SECTION_PATTERNS = {
+    'personal_info': r'(?:personal\s+(?:information|details)|contact|profile)',
+    'summary': r'(?:summary|objective|profile|about)',
+    'experience': r'(?:experience|employment|work\s+history|professional\s+experience)',
+    'education': r'(?:education|academic|qualification)',
+    'skills': r'(?:skills|technical\s+skills|competencies|expertise)',
+    'projects': r'(?:projects|portfolio)',
+    'certifications': r'(?:certifications?|licenses?|awards?)',
+    'languages': r'(?:languages?)',
+}
+
+# One pass over the whole text finds every header line: a line of at most five
+# words containing one of the patterns above. Each word must be followed by
+# whitespace or the line end, which keeps the word-count lookahead linear.
+# Alternatives are tried in dict order, and the empty named group tells which
+# section matched. '\s' inside a pattern becomes '[^\S\n]' so that a keyword
+# such as 'technical\s+skills' cannot continue onto the next line.
+_SECTION_HEADER_RE = re.compile(
+    r'^(?=[^\S\n]*(?:\S+[^\S\n]+){0,4}\S+[^\S\n]*$)(?:'
+    + '|'.join(rf'(?=[^\n]*?{pattern})(?P<{name}>)'.replace(r'\s', r'[^\S\n]')
+               for name, pattern in _SECTION_PATTERNS.items())
+    + ')',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Contact details, found in one scan. Emails and profile URLs come before
+# phone numbers so digits inside them aren't reported as a phone number.
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_CONTACT_RE = re.compile(
+    rf'(?P<email>{_EMAIL_PATTERN})'
+    r'|(?P<linkedin>(?:linkedin\.com/in/|linkedin\.com/profile/)[a-zA-Z0-9-]+)'
+    r'|(?P<github>github\.com/[a-zA-Z0-9-]+)'
+    r'|(?P<phone>(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})',
+    re.IGNORECASE
+)
+_CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github')
 
 
 def clean_text(text: str) -> str:
@@ -21,14 +103,16 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Remove non-printable characters (keeping whitespace) and list bullets
+    text = text.translate(_PRINTABLE_TABLE)
     
-    # Remove non-printable characters but keep newlines
-    text = ''.join(char for char in text if char.isprintable() or char == '\n')
+    # Collapse horizontal whitespace; newlines are kept so that the
+    # line-based section and entry extraction downstream still sees lines
+    text = _HSPACE_RE.sub(' ', text)
     
-    # Normalize line breaks
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    # Trim lines and allow at most one blank line in a row
+    text = _LINE_EDGE_RE.sub('\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -46,7 +130,7 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Text with normalized whitespace
     """
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def remove_urls(text: str) -> str:
@@ -59,8 +143,7 @@ def remove_urls(text: str) -> str:
     Returns:
         Text with URLs removed
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    return re.sub(url_pattern, '', text)
+    return _URL_RE.sub('', text)
 
 
 def extract_sections(text: str) -> Dict[str, str]:
@@ -73,43 +156,24 @@ def extract_sections(text: str) -> Dict[str, str]:
     Returns:
         Dictionary with section names as keys and section content as values
     """
-    sections = {}
-    
-    # Common section headers (case-insensitive)
-    section_patterns = {
-        'personal_info': r'(?:personal\s+(?:information|details)|contact|profile)',
-        'summary': r'(?:summary|objective|profile|about)',
-        'experience': r'(?:experience|employment|work\s+history|professional\s+experience)',
-        'education': r'(?:education|academic|qualification)',
-        'skills': r'(?:skills|technical\s+skills|competencies|expertise)',
-        'projects': r'(?:projects|portfolio)',
-        'certifications': r'(?:certifications?|licenses?|awards?)',
-        'languages': r'(?:languages?)',
-    }
-    
-    # Try to identify section boundaries
-    lines = text.split('\n')
     current_section = 'header'
-    section_content = {current_section: []}
-    
-    for line in lines:
-        line_lower = line.lower().strip()
+    section_content = defaultdict(list)
+    
+    # Slice the text between consecutive header lines
+    start = 0
+    for match in _SECTION_HEADER_RE.finditer(text):
+        if match.start() > start:
+            # Content lines before this header, without the trailing newline
+            section_content[current_section].append(text[start:match.start() - 1])
         
-        # Check if line is a section header
-        matched_section = None
-        for section_name, pattern in section_patterns.items():
-            if re.search(pattern, line_lower) and len(line.split()) <= 5:
-                matched_section = section_name
-                break
+        current_section = match.lastgroup
+        section_content[current_section]  # keep sections in header order
         
-        if matched_section:
-            current_section = matched_section
-            if current_section not in section_content:
-                section_content[current_section] = []
-        else:
-            if current_section not in section_content:
-                section_content[current_section] = []
-            section_content[current_section].append(line)
+        line_end = text.find('\n', match.start())
+        start = len(text) + 1 if line_end == -1 else line_end + 1
+    
+    if start <= len(text):
+        section_content[current_section].append(text[start:])
     
     # Join content for each section
     sections = {k: '\n'.join(v).strip() for k, v in section_content.items() if v}
@@ -127,56 +191,59 @@ def extract_contact_info(text: str) -> Dict[str, str]:
     Returns:
         Dictionary with contact information
     """
-    contact_info = {}
-    
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    if emails:
-        contact_info['email'] = emails[0]
-    
-    # Phone pattern (various formats)
-    phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phones = re.findall(phone_pattern, text)
-    if phones:
-        contact_info['phone'] = phones[0]
-    
-    # LinkedIn pattern
-    linkedin_pattern = r'(?:linkedin\.com/in/|linkedin\.com/profile/)([a-zA-Z0-9-]+)'
-    linkedin = re.search(linkedin_pattern, text, re.IGNORECASE)
-    if linkedin:
-        contact_info['linkedin'] = linkedin.group(0)
-    
-    # GitHub pattern
-    github_pattern = r'(?:github\.com/)([a-zA-Z0-9-]+)'
-    github = re.search(github_pattern, text, re.IGNORECASE)
-    if github:
-        contact_info['github'] = github.group(0)
+    found = {}
+    
+    # Emails get their own search: in the shared scan a phone number running
+    # straight into an email would consume the start of the address
+    email = _EMAIL_RE.search(text)
+    if email:
+        found['email'] = email.group(0)
+    
+    # First occurrence of each other field; stop once all of them are found
+    for match in _CONTACT_RE.finditer(text):
+        if match.lastgroup != 'email':
+            found.setdefault(match.lastgroup, match.group(0))
+        if len(found) == len(_CONTACT_FIELDS):
+            break
+    
+    contact_info = {field: found[field] for field in _CONTACT_FIELDS if field in found}
     
     return contact_info
 
 
+@functools.lru_cache(maxsize=128)
+def _preprocess_cached(text: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    """Clean the text and extract sections and contact info (memoized on the text)."""
+    # Clean the text
+    cleaned_text = clean_text(text)
+    
+    # Extract sections
+    sections = extract_sections(cleaned_text)
+    
+    # Extract contact information
+    contact_info = extract_contact_info(cleaned_text)
+    
+    return cleaned_text, sections, contact_info
+
+
 def preprocess_resume_text(text: str) -> Dict[str, any]:
     """
     Main preprocessing function that cleans text and extracts sections.
     
+    Results are cached per input text, so re-processing the same resume
+    is free; each call still returns its own dictionaries.
+    
     Args:
         text: Raw resume text
         
     Returns:
         Dictionary containing cleaned text, sections, and contact info
     """
-    # Clean the text
-    cleaned_text = clean_text(text)
-    
-    # Extract sections
-    sections = extract_sections(cleaned_text)
-    
-    # Extract contact information
-    contact_info = extract_contact_info(cleaned_text)
+    cleaned_text, sections, contact_info = _preprocess_cached(text)
     
+    # Copy the cached dicts so callers can modify the result safely
     return {
         'cleaned_text': cleaned_text,
-        'sections': sections,
-        'contact_info': contact_info
+        'sections': dict(sections),
+        'contact_info': dict(contact_info)
     }